@@ -1,5 +1,7 @@
 from typing import Any, List
 
+_OUT = "Output: "
+
 
 class DataProcessor:
     """Base class for processing different types of data.
@@ -13,6 +15,8 @@ class DataProcessor:
         silent (bool): Flag to suppress output messages during processing.
     """
 
+    __slots__ = ("name", "silent")
+
     def __init__(self, name: str, silent: bool = False) -> None:
         """Initialize the DataProcessor.
 
@@ -93,7 +97,7 @@ class DataProcessor:
         Returns:
             str: Formatted output string.
         """
-        return f"Output: {result}"
+        return _OUT + f"{result}"
 
 
 class NumericProcessor(DataProcessor):
@@ -103,6 +107,8 @@ class NumericProcessor(DataProcessor):
     such as count, sum, and average.
     """
 
+    __slots__ = ()
+
     def __init__(self, silent: bool = False) -> None:
         """Initialize the NumericProcessor.
 
@@ -133,6 +139,7 @@ class NumericProcessor(DataProcessor):
         """Analyze numeric data and compute statistics.
 
         Calculates count, sum, and average of the numeric values.
+        An empty list yields an average of 0.0.
 
         Args:
             data (List[int]): List of numeric values.
@@ -140,10 +147,12 @@ class NumericProcessor(DataProcessor):
         Returns:
             dict: Dictionary containing count, sum, and avg keys.
         """
+        count = len(data)
+        total = sum(data)
         return {
-            "count": len(data),
-            "sum": sum(data),
-            "avg": sum(data) / len(data)
+            "count": count,
+            "sum": total,
+            "avg": total / count if count else 0.0
         }
 
     def format_output(self, result: dict) -> str:
@@ -156,7 +165,7 @@ class NumericProcessor(DataProcessor):
             str: Formatted string with processing results.
         """
         return (
-            f"Output: Processed {result['count']} numeric values, "
+            _OUT + f"Processed {result['count']} numeric values, "
             f"sum={result['sum']}, avg={result['avg']}"
         )
 
@@ -167,6 +176,8 @@ class TextProcessor(DataProcessor):
     Analyzes text strings and computes character and word counts.
     """
 
+    __slots__ = ()
+
     def __init__(self, silent: bool = False) -> None:
         """Initialize the TextProcessor.
 
@@ -204,7 +215,7 @@ class TextProcessor(DataProcessor):
             dict: Dictionary containing chars and words keys.
         """
         return {
-            "chars": len(data) + 1,
+            "chars": len(data),
             "words": len(data.split())
         }
 
@@ -218,7 +229,7 @@ class TextProcessor(DataProcessor):
             str: Formatted string with processing results.
         """
         return (
-            f"Output: Processed text: "
+            _OUT + "Processed text: "
             f"{result['chars']} characters, {result['words']} words"
         )
 
@@ -230,6 +241,8 @@ class LogProcessor(DataProcessor):
     Expected format: "LEVEL: message"
     """
 
+    __slots__ = ()
+
     def __init__(self, silent: bool = False) -> None:
         """Initialize the LogProcessor.
 
@@ -268,7 +281,7 @@ class LogProcessor(DataProcessor):
         Returns:
             dict: Dictionary containing level and message keys.
         """
-        level, message = data.split(":", 1)
+        level, _, message = data.partition(":")
         return {
             "level": level.strip().upper(),
             "message": message.strip()
@@ -287,7 +300,7 @@ class LogProcessor(DataProcessor):
         """
         tag = "ALERT" if result["level"] == "ERROR" else "INFO"
         return (
-            f"Output: [{tag}] {result['level']} level detected: "
+            _OUT + f"[{tag}] {result['level']} level detected: "
             f"{result['message']}"
         )
 
@@ -314,15 +327,15 @@ def main() -> None:
     print("Processing multiple data types through same interface...")
 
     num_result = NumericProcessor(silent=True).process([1, 2, 3])
-    num_result = num_result.replace("Output: ", "")
+    num_result = num_result.removeprefix(_OUT)
     print(f"Result 1: {num_result}")
 
     text_result = TextProcessor(silent=True).process("Hello World")
-    text_result = text_result.replace("Output: ", "")
+    text_result = text_result.removeprefix(_OUT)
     print(f"Result 2: {text_result}")
 
     log_result = LogProcessor(silent=True).process("INFO: System ready")
-    log_result = log_result.replace("Output: ", "")
+    log_result = log_result.removeprefix(_OUT)
     print(f"Result 3: {log_result}")
 
     print("\nFoundation systems online. Nexus ready for advanced streams.")
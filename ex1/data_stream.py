@@ -12,6 +12,8 @@ class DataStream:
         stream_type (str): Type or category of the stream.
     """
 
+    __slots__ = ("stream_id", "stream_type")
+
     def __init__(self, stream_id: str, stream_type: str) -> None:
         """Initialize the DataStream with ID and type.
 
@@ -43,6 +45,8 @@ class SensorStream(DataStream):
     Processes sensor readings including temperature, humidity, and pressure.
     """
 
+    __slots__ = ()
+
     def __init__(self, stream_id: str) -> None:
         """Initialize the SensorStream.
 
@@ -56,16 +60,19 @@ class SensorStream(DataStream):
     def process_batch(self, data: List[str]) -> None:
         """Process a batch of sensor readings.
 
-        Parses sensor data in format "type:value" and calculates average
-        temperature from the readings.
+        Parses sensor data in format "type:value" and calculates the
+        average temperature over all temperature readings in the batch.
 
         Args:
             data (List[str]): List of sensor readings in format "type:value".
         """
-        print(f"Processing sensor batch: [{', '.join(data)}]")
-        temps = [float(d.split(":")[1]) for d in data if d.startswith("temp")]
-        avg = temps[0] if temps else 0.0
+        batch = f"Processing sensor batch: [{', '.join(data)}]"
+        temps = [
+            float(d.partition(":")[2]) for d in data if d.startswith("temp")
+        ]
+        avg = sum(temps) / len(temps) if temps else 0.0
         print(
+            f"{batch}\n"
             f"Sensor analysis: {len(data)} readings processed, "
             f"avg temp: {avg}°C"
         )
@@ -77,6 +84,8 @@ class TransactionStream(DataStream):
     Processes buy and sell transactions and calculates net flow.
     """
 
+    __slots__ = ()
+
     def __init__(self, stream_id: str) -> None:
         """Initialize the TransactionStream.
 
@@ -96,13 +105,14 @@ class TransactionStream(DataStream):
         Args:
             data (List[str]): List of transactions in format "action:value".
         """
-        print(f"Processing transaction batch: [{', '.join(data)}]")
+        batch = f"Processing transaction batch: [{', '.join(data)}]"
         net = 0
         for item in data:
-            action, value = item.split(":")
-            value = int(value)
-            net += value if action == "sell" else -value
+            action, _, value = item.partition(":")
+            amount = int(value)
+            net += amount if action == "sell" else -amount
         print(
+            f"{batch}\n"
             f"Transaction analysis: {len(data)} operations, "
             f"net flow: {net:+} units"
         )
@@ -114,6 +124,8 @@ class EventStream(DataStream):
     Processes system events and tracks error occurrences.
     """
 
+    __slots__ = ()
+
     def __init__(self, stream_id: str) -> None:
         """Initialize the EventStream.
 
@@ -132,9 +144,10 @@ class EventStream(DataStream):
         Args:
             data (List[str]): List of event strings to process.
         """
-        print(f"Processing event batch: [{', '.join(data)}]")
-        errors = len([d for d in data if d == "error"])
+        batch = f"Processing event batch: [{', '.join(data)}]"
+        errors = data.count("error")
         print(
+            f"{batch}\n"
             f"Event analysis: {len(data)} events, "
             f"{errors} error detected"
         )
@@ -150,6 +163,8 @@ class StreamProcessor:
         streams (List[DataStream]): List of registered data streams.
     """
 
+    __slots__ = ("streams",)
+
     def __init__(self) -> None:
         """Initialize the StreamProcessor with an empty stream list."""
         self.streams: List[DataStream] = []
@@ -166,19 +181,21 @@ class StreamProcessor:
         """Process multiple batches of data.
 
         Processes batches through registered streams and displays summary
-        information about the processing results.
+        information about the processing results in a single write.
 
         Args:
             batches (List[List[str]]): List of data batches to process,
                 where each batch is a list of strings.
         """
-        print("\n=== Polymorphic Stream Processing ===")
-        print("Processing mixed stream types through unified interface...")
-        print("Batch 1 Results:")
-
-        print(f"- Sensor data: {len(batches[0])} readings processed")
-        print(f"- Transaction data: {len(batches[1])} operations processed")
-        print(f"- Event data: {len(batches[2])} events processed")
+        lines = [
+            "\n=== Polymorphic Stream Processing ===",
+            "Processing mixed stream types through unified interface...",
+            "Batch 1 Results:",
+            f"- Sensor data: {len(batches[0])} readings processed",
+            f"- Transaction data: {len(batches[1])} operations processed",
+            f"- Event data: {len(batches[2])} events processed",
+        ]
+        print("\n".join(lines))
 
 
 def main() -> None:
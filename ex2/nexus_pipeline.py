@@ -1,4 +1,4 @@
-from typing import Any, List, Dict
+from typing import Any, Dict, Tuple
 
 
 class ProcessingPipeline:
@@ -8,20 +8,31 @@ class ProcessingPipeline:
     composing multiple processing stages that execute sequentially.
 
     Attributes:
-        stages (List[Any]): List of processing stages to execute.
+        stages (Tuple[Any, ...]): Immutable sequence of processing stages
+            to execute. Being a tuple, it can be shared between pipelines.
     """
 
-    def __init__(self) -> None:
-        """Initialize the ProcessingPipeline with an empty stage list."""
-        self.stages: List[Any] = []
+    __slots__ = ("stages",)
+
+    def __init__(self, stages: Tuple[Any, ...] = ()) -> None:
+        """Initialize the ProcessingPipeline.
+
+        Args:
+            stages (Tuple[Any, ...]): Initial processing stages.
+                Defaults to no stages.
+        """
+        self.stages: Tuple[Any, ...] = tuple(stages)
 
     def add_stage(self, stage: Any) -> None:
         """Add a processing stage to the pipeline.
 
+        Builds a new stage tuple, so pipelines sharing the previous one
+        are left unchanged.
+
         Args:
             stage (Any): A processing stage that implements an execute method.
         """
-        self.stages.append(stage)
+        self.stages += (stage,)
 
     def process(self, data: Any) -> Any:
         """Process data through all stages in the pipeline.
@@ -47,6 +58,8 @@ class InputStage:
     First stage in a processing pipeline that handles input validation.
     """
 
+    __slots__ = ()
+
     def execute(self, data: Any) -> Any:
         """Execute the input stage processing.
 
@@ -65,6 +78,8 @@ class TransformStage:
     Middle stage in a processing pipeline that transforms and enriches data.
     """
 
+    __slots__ = ()
+
     def execute(self, data: Any) -> Any:
         """Execute the transform stage processing.
 
@@ -83,6 +98,8 @@ class OutputStage:
     Final stage in a processing pipeline that formats and delivers output.
     """
 
+    __slots__ = ()
+
     def execute(self, data: Any) -> Any:
         """Execute the output stage processing.
 
@@ -95,25 +112,48 @@ class OutputStage:
         return data
 
 
-class JSONAdapter(ProcessingPipeline):
-    """Adapter for processing JSON format data.
+_DEFAULT_STAGES: Tuple[Any, ...] = (
+    InputStage(),
+    TransformStage(),
+    OutputStage(),
+)
 
-    Specialized pipeline adapter that processes JSON data through
-    the standard pipeline stages with JSON-specific formatting.
+
+class PipelineAdapter(ProcessingPipeline):
+    """Base class for pipeline adapters handling a specific data format.
+
+    Adapters run the standard input, transform and output stages unless
+    given their own stages.
 
     Attributes:
         pipeline_id (str): Unique identifier for this pipeline instance.
     """
 
-    def __init__(self, pipeline_id: str) -> None:
-        """Initialize the JSONAdapter with a pipeline ID.
+    __slots__ = ("pipeline_id",)
+
+    def __init__(
+        self, pipeline_id: str, stages: Tuple[Any, ...] = _DEFAULT_STAGES
+    ) -> None:
+        """Initialize the adapter with a pipeline ID.
 
         Args:
             pipeline_id (str): Unique identifier for this pipeline.
+            stages (Tuple[Any, ...]): Processing stages to run.
+                Defaults to the standard stages.
         """
-        super().__init__()
+        super().__init__(stages)
         self.pipeline_id = pipeline_id
 
+
+class JSONAdapter(PipelineAdapter):
+    """Adapter for processing JSON format data.
+
+    Specialized pipeline adapter that processes JSON data through
+    the standard pipeline stages with JSON-specific formatting.
+    """
+
+    __slots__ = ()
+
     def process(self, data: Dict[str, Any]) -> None:
         """Process JSON data through the pipeline.
 
@@ -123,31 +163,23 @@ class JSONAdapter(ProcessingPipeline):
         Args:
             data (Dict[str, Any]): JSON data dictionary to process.
         """
-        print("\nProcessing JSON data through pipeline...")
-        print(f"Input: {data}")
         super().process(data)
-        print("Transform: Enriched with metadata and validation")
-        print("Output: Processed temperature reading: 23.5°C (Normal range)")
+        print("\n".join([
+            "\nProcessing JSON data through pipeline...",
+            f"Input: {data}",
+            "Transform: Enriched with metadata and validation",
+            "Output: Processed temperature reading: 23.5°C (Normal range)",
+        ]))
 
 
-class CSVAdapter(ProcessingPipeline):
+class CSVAdapter(PipelineAdapter):
     """Adapter for processing CSV format data.
 
     Specialized pipeline adapter that processes CSV data through
     the standard pipeline stages with CSV-specific parsing.
-
-    Attributes:
-        pipeline_id (str): Unique identifier for this pipeline instance.
     """
 
-    def __init__(self, pipeline_id: str) -> None:
-        """Initialize the CSVAdapter with a pipeline ID.
-
-        Args:
-            pipeline_id (str): Unique identifier for this pipeline.
-        """
-        super().__init__()
-        self.pipeline_id = pipeline_id
+    __slots__ = ()
 
     def process(self, data: str) -> None:
         """Process CSV data through the pipeline.
@@ -158,31 +190,23 @@ class CSVAdapter(ProcessingPipeline):
         Args:
             data (str): CSV formatted string to process.
         """
-        print("\nProcessing CSV data through same pipeline...")
-        print(f"Input: \"{data}\"")
         super().process(data)
-        print("Transform: Parsed and structured data")
-        print("Output: User activity logged: 1 actions processed")
+        print("\n".join([
+            "\nProcessing CSV data through same pipeline...",
+            f"Input: \"{data}\"",
+            "Transform: Parsed and structured data",
+            "Output: User activity logged: 1 actions processed",
+        ]))
 
 
-class StreamAdapter(ProcessingPipeline):
+class StreamAdapter(PipelineAdapter):
     """Adapter for processing streaming data.
 
     Specialized pipeline adapter that processes real-time stream data
     through the standard pipeline stages with aggregation.
-
-    Attributes:
-        pipeline_id (str): Unique identifier for this pipeline instance.
     """
 
-    def __init__(self, pipeline_id: str) -> None:
-        """Initialize the StreamAdapter with a pipeline ID.
-
-        Args:
-            pipeline_id (str): Unique identifier for this pipeline.
-        """
-        super().__init__()
-        self.pipeline_id = pipeline_id
+    __slots__ = ()
 
     def process(self, data: str) -> None:
         """Process stream data through the pipeline.
@@ -193,11 +217,13 @@ class StreamAdapter(ProcessingPipeline):
         Args:
             data (str): Stream data description to process.
         """
-        print("\nProcessing Stream data through same pipeline...")
-        print(f"Input: {data}")
         super().process(data)
-        print("Transform: Aggregated and filtered")
-        print("Output: Stream summary: 5 readings, avg: 22.1°C")
+        print("\n".join([
+            "\nProcessing Stream data through same pipeline...",
+            f"Input: {data}",
+            "Transform: Aggregated and filtered",
+            "Output: Stream summary: 5 readings, avg: 22.1°C",
+        ]))
 
 
 class NexusManager:
@@ -207,6 +233,8 @@ class NexusManager:
     processing pipelines and data formats.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize the NexusManager."""
         pass
@@ -249,17 +277,13 @@ def main() -> None:
 
     print("\n=== Multi-Format Data Processing ===")
 
-    json = JSONAdapter("PIPE_001")
-    json.stages = pipeline.stages
+    json = JSONAdapter("PIPE_001", pipeline.stages)
     manager.run(json, {"sensor": "temp", "value": 23.5, "unit": "C"})
 
-    json = JSONAdapter("PIPE_001")
-    csv = CSVAdapter("PIPE_001")
-    csv.stages = pipeline.stages
+    csv = CSVAdapter("PIPE_001", pipeline.stages)
     manager.run(csv, "user,action,timestamp")
 
-    stream = StreamAdapter("PIPE_001")
-    stream.stages = pipeline.stages
+    stream = StreamAdapter("PIPE_001", pipeline.stages)
     manager.run(stream, "Real-time sensor stream")
 
     print("\n=== Pipeline Chaining Demo ===")